@@ -7,7 +7,80 @@ Functions to calculate different types of degree distribution:
 '''
 
 import numpy as np
-import pandas as pd
+
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    njit = None
+
+# below this size the JIT'ed kernels are not worth their call overhead
+_NUMBA_MIN_SIZE = 1 << 17
+
+def _ensure_int_array(degrees):
+    '''Normalize degrees to an integer ndarray, without copying ndarray input.'''
+    if isinstance(degrees, np.ndarray) and degrees.dtype.kind == 'i':
+        return degrees
+    return np.asarray(degrees, dtype=np.int64)
+
+def _cdf(deg, x):
+    '''
+    Fraction of degrees strictly greater than each split point of x.
+
+    Keep this free of np.vectorize and per-split Python scans: vectorize is
+    just a Python loop, and evaluating the degrees once per split made the
+    cumulative distributions O(N*n_bins) in the interpreter.
+    '''
+    n = len(deg)
+    if deg.max() < 16*n:
+        # dense integer degrees: cumulative bincount sampled by integer
+        # indexing, O(N + max_degree) with no sort
+        cum = np.cumsum(np.bincount(deg))
+        idx = np.clip(x.astype(np.intp), 0, len(cum) - 1)
+        return (n - cum[idx])/n
+    if njit is not None and deg.size >= _NUMBA_MIN_SIZE:
+        return (n - np.cumsum(_cdf_counts(deg, x))[:len(x)])/n
+    deg = np.sort(deg)
+    return (n - np.searchsorted(deg, x, side='right'))/n
+
+if njit is not None:
+    @njit(parallel=True)
+    def _cdf_counts(deg, x):
+        '''
+        Count degrees falling between consecutive split points of x in one
+        parallel pass, with per-thread local histograms merged at the end.
+        counts[k] is the number of degrees d with exactly k splits below d.
+        '''
+        n = deg.shape[0]
+        n_threads = get_num_threads()
+        chunk = (n + n_threads - 1)//n_threads
+        local = np.zeros((n_threads, x.shape[0] + 1), dtype=np.int64)
+        for t in prange(n_threads):
+            for i in range(t*chunk, min((t + 1)*chunk, n)):
+                local[t, np.searchsorted(x, deg[i])] += 1
+        return local.sum(axis=0)
+
+    @njit(cache=True)
+    def _rle(sorted_deg):
+        '''
+        Run-length encode a sorted degree array into (values, counts) in a
+        single streaming pass, without np.unique's extra diff/mask passes.
+        '''
+        n = sorted_deg.shape[0]
+        vals = np.empty(n, dtype=sorted_deg.dtype)
+        counts = np.empty(n, dtype=np.int64)
+        m = 0
+        run = 1
+        for i in range(1, n):
+            if sorted_deg[i] == sorted_deg[i-1]:
+                run += 1
+            else:
+                vals[m] = sorted_deg[i-1]
+                counts[m] = run
+                m += 1
+                run = 1
+        vals[m] = sorted_deg[n-1]
+        counts[m] = run
+        return vals[:m+1], counts[:m+1]
 
 def degree_distribution(degrees):
     '''
@@ -24,9 +97,21 @@ def degree_distribution(degrees):
         degree distribution
     
     '''
-    rho = np.bincount(degrees).astype(float)/len(degrees)
-    k = np.arange(len(degrees))[np.nonzero(rho)]
-    rho_k = rho[np.nonzero(rho)]
+    degrees = _ensure_int_array(degrees)
+    if degrees.max() < 4*len(degrees):
+        # dense degree range: bincount is one pass over a small counts array
+        rho = np.bincount(degrees).astype(float)/len(degrees)
+        nz = rho != 0
+        k = np.flatnonzero(nz)
+        rho_k = rho[nz]
+    else:
+        # sparse degree range (max degree >> distinct degrees): avoid the
+        # O(max_degree) counts allocation
+        if njit is not None and degrees.size >= _NUMBA_MIN_SIZE:
+            k, counts = _rle(np.sort(degrees))
+        else:
+            k, counts = np.unique(degrees, return_counts=True)
+        rho_k = counts/len(degrees)
     return k, rho_k
 
 def log_binning(degrees, num):
@@ -46,13 +131,24 @@ def log_binning(degrees, num):
         degree distribution
     
     '''
-    df = pd.DataFrame({
-        'degree' : np.arange(max(degrees)+1)[max(1, min(degrees)):],
-        'freq' : np.bincount(degrees).astype(float)[max(1, min(degrees)):]/len(degrees)
-    })
-    df['bin'] = np.digitize(df.degree, bins=np.geomspace(df.degree.min(), df.degree.max(), num=num, endpoint=False))
-    x = df.groupby('bin').mean().degree
-    y = df.groupby('bin').mean().freq
+    degrees = _ensure_int_array(degrees)
+    lo = max(1, degrees.min())
+    counts = np.bincount(degrees)
+    deg = np.arange(lo, len(counts))
+    freq = counts[lo:].astype(float)/len(degrees)
+    log_range = np.log(deg[-1]) - np.log(lo)
+    if log_range == 0:
+        return deg.astype(float), freq
+    # closed-form bin index on the uniform log-space grid, instead of
+    # np.digitize against materialized np.geomspace edges
+    bin_idx = np.floor(num*(np.log(deg) - np.log(lo))/log_range).astype(np.intp)
+    np.minimum(bin_idx, num - 1, out=bin_idx)
+    # bin_idx is non-decreasing along the degree axis, so each non-empty bin
+    # is a contiguous run and per-bin sums reduce to np.add.reduceat
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bin_idx)) + 1))
+    bin_counts = np.diff(np.append(starts, len(bin_idx)))
+    x = np.add.reduceat(deg, starts)/bin_counts
+    y = np.add.reduceat(freq, starts)/bin_counts
     return x, y
 
 def cumulative_distribution(degrees, n_bins):
@@ -72,10 +168,9 @@ def cumulative_distribution(degrees, n_bins):
         degree distribution
     
     '''
-    right_prop = np.vectorize(lambda split, x=degrees: np.sum([i > split for i in degrees]).astype(float)/len(degrees))
-    x = np.linspace(min(degrees), max(degrees)+1, n_bins, endpoint=True)
-    y = right_prop(x)
-    return x, y
+    deg = _ensure_int_array(degrees)
+    x = np.linspace(deg.min(), deg.max()+1, n_bins, endpoint=True)
+    return x, _cdf(deg, x)
 
 def log_cumulative_distribution(degrees, n_bins):
     '''
@@ -94,7 +189,6 @@ def log_cumulative_distribution(degrees, n_bins):
         degree distribution
     
     '''
-    right_prop = np.vectorize(lambda split, x=degrees: np.sum([i > split for i in degrees]).astype(float)/len(degrees))
-    x = np.geomspace(max(1, min(degrees)), max(degrees)+1, n_bins, endpoint=True)
-    y = right_prop(x)
-    return x, y
\ No newline at end of file
+    deg = _ensure_int_array(degrees)
+    x = np.geomspace(max(1, deg.min()), deg.max()+1, n_bins, endpoint=True)
+    return x, _cdf(deg, x)
\ No newline at end of file
@@ -33,6 +33,9 @@ Get networks data from '/simple' folder and plot average out-degree distribution
 '''
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -52,9 +55,15 @@ def save_G_coords(G_coords, edgelist_path, coords_path):
     
     '''
     G, coords = G_coords
-    nx.write_edgelist(G, edgelist_path, data=False)
     cols = ('theta', 'radius') if len(coords) == 2 else ('theta', 'radius_p', 'radius_m')
-    pd.DataFrame(dict(zip(cols, coords))).to_csv(coords_path, index=None, sep=' ')
+    if edgelist_path.endswith('.npy'):
+        np.save(edgelist_path, np.asarray(G.edges(), dtype=np.int32).reshape(-1, 2))
+    else:
+        nx.write_edgelist(G, edgelist_path, data=False)
+    if coords_path.endswith('.npz'):
+        np.savez(coords_path, **dict(zip(cols, coords)))
+    else:
+        pd.DataFrame(dict(zip(cols, coords))).to_csv(coords_path, index=None, sep=' ')
 
 def get_G_coords(edgelist_path, coords_path):
     '''
@@ -73,37 +82,62 @@ def get_G_coords(edgelist_path, coords_path):
         network graph and points coordinates
 
     '''
-    df = pd.read_csv(coords_path, delimiter=' ')
-    cols = ('theta', 'radius') if len(df.columns) == 2 else ('theta', 'radius_p', 'radius_m')
-    coords = tuple(df[col].values for col in cols)
-    G = nx.read_edgelist(edgelist_path, create_using=nx.DiGraph(), nodetype=int)
-    G.add_nodes_from([i for i in range(len(df))])
+    if coords_path.endswith('.npz'):
+        npz = np.load(coords_path)
+        cols = ('theta', 'radius') if len(npz.files) == 2 else ('theta', 'radius_p', 'radius_m')
+        coords = tuple(npz[col] for col in cols)
+    else:
+        df = pd.read_csv(coords_path, sep=' ', dtype=np.float64, engine='c')
+        cols = ('theta', 'radius') if len(df.columns) == 2 else ('theta', 'radius_p', 'radius_m')
+        coords = tuple(df[col].values for col in cols)
+    if edgelist_path.endswith('.npy'):
+        edges = np.load(edgelist_path)
+        edges_df = pd.DataFrame({'source': edges[:, 0], 'target': edges[:, 1]})
+    else:
+        try:
+            edges_df = pd.read_csv(edgelist_path, sep=' ', header=None,
+                                   names=['source', 'target'], dtype=np.int64, engine='c')
+        except pd.errors.EmptyDataError:
+            edges_df = pd.DataFrame({'source': [], 'target': []})
+    G = nx.from_pandas_edgelist(edges_df, create_using=nx.DiGraph)
+    G.add_nodes_from(range(len(coords[0])))
     return G, coords
 
-def save_networks(networks, path):
+def save_networks(networks, path, batch=False):
     '''
     Saves networks coordinates and lists of networks edges.
-    
+
     Parameters
     ----------
     networks : list of (networkx DiGraph, (numpy array, numpy array[, numpy array]))
         networks graphs and coordinates
     path : file or string
         file or filename to write
-    
+    batch : bool, default=False
+        if True, write all networks into two columnar files
+        ('edges.npy' with network id, source, target columns and
+        'coords.npz') instead of one pair of files per network
+
     '''
     if not os.path.exists(path):
         os.mkdir(path)
     elif len(os.listdir(path)) > 0:
         raise Exception("The directory is not empty.")
-    edgelist_paths = []
-    coords_paths = []
-    for i, G_coords in enumerate(networks):
-        e_path = os.path.join(path, 'edgelist_{}.txt'.format(i))
-        c_path = os.path.join(path, 'coords_{}.txt'.format(i))
-        edgelist_paths.append(e_path)
-        coords_paths.append(c_path)
-        save_G_coords(G_coords, e_path, c_path)
+    if batch:
+        edges = np.concatenate([
+            np.column_stack((np.full(G.number_of_edges(), i, dtype=np.int32),
+                             np.asarray(G.edges(), dtype=np.int32).reshape(-1, 2)))
+            for i, (G, coords) in enumerate(networks)])
+        np.save(os.path.join(path, 'edges.npy'), edges)
+        cols = ('theta', 'radius') if len(networks[0][1]) == 2 else ('theta', 'radius_p', 'radius_m')
+        nid = np.concatenate([np.full(len(coords[0]), i, dtype=np.int32) for i, (G, coords) in enumerate(networks)])
+        stacked = {col: np.concatenate([coords[j] for G, coords in networks]) for j, col in enumerate(cols)}
+        np.savez(os.path.join(path, 'coords.npz'), nid=nid, **stacked)
+        return
+    edgelist_paths = [os.path.join(path, 'edgelist_{}.npy'.format(i)) for i in range(len(networks))]
+    coords_paths = [os.path.join(path, 'coords_{}.npz'.format(i)) for i in range(len(networks))]
+    with ThreadPoolExecutor() as ex:
+        list(ex.map(save_G_coords, networks, edgelist_paths, coords_paths))
 
 def get_networks(path):
     '''
@@ -120,11 +154,39 @@ def get_networks(path):
         networks graphs and coordinates
 
     '''
+    if os.path.exists(os.path.join(path, 'edges.npy')):
+        return _get_networks_batch(path)
+    file_rx = re.compile(r'(edgelist|coords)_(\d+)\.\w+$')
+    paths = {'edgelist': {}, 'coords': {}}
+    for name in os.listdir(path):
+        m = file_rx.match(name)
+        if m:
+            paths[m.group(1)][int(m.group(2))] = os.path.join(path, name)
+    indices = sorted(paths['edgelist'])
+    edgelist_paths = [paths['edgelist'][i] for i in indices]
+    coords_paths = [paths['coords'][i] for i in indices]
+    with ThreadPoolExecutor() as ex:
+        return list(ex.map(get_G_coords, edgelist_paths, coords_paths))
+
+def _get_networks_batch(path):
+    '''Load networks written by save_networks(..., batch=True).'''
+    edges = np.load(os.path.join(path, 'edges.npy'))
+    npz = np.load(os.path.join(path, 'coords.npz'))
+    nid = npz['nid']
+    cols = ('theta', 'radius') if len(npz.files) == 3 else ('theta', 'radius_p', 'radius_m')
+    stacked = tuple(npz[col] for col in cols)
     networks = []
-    edgelist_paths = sorted([os.path.join(path, p) for p in os.listdir(path) if 'edgelist' in p])
-    coords_paths = sorted([os.path.join(path, p) for p in os.listdir(path) if 'coords' in p])
-    for e_path, c_path in zip(edgelist_paths, coords_paths):
-        networks.append(get_G_coords(e_path, c_path))
+    n_networks = int(nid[-1]) + 1 if len(nid) else 0
+    # both files are written in ascending network id order, so each network
+    # is a contiguous slice found by binary search
+    e_starts = np.searchsorted(edges[:, 0], np.arange(n_networks + 1))
+    c_starts = np.searchsorted(nid, np.arange(n_networks + 1))
+    for i in range(n_networks):
+        G = nx.DiGraph()
+        G.add_edges_from(edges[e_starts[i]:e_starts[i+1], 1:].tolist())
+        G.add_nodes_from(range(c_starts[i+1] - c_starts[i]))
+        coords = tuple(col[c_starts[i]:c_starts[i+1]] for col in stacked)
+        networks.append((G, coords))
     return networks
 
 def get_degrees(deg_type, *networks):
@@ -140,12 +202,20 @@ def get_degrees(deg_type, *networks):
     
     Returns
     -------
-    list of integers
-        union list of networks degrees
+    numpy array
+        union array of networks degrees
 
     '''
-    deg_func = lambda G: {'all': G.degree, 'in': G.in_degree, 'out': G.out_degree}
-    return [d for G, coords in networks for n, d in deg_func(G)[deg_type]()]
+    attr = {'all': 'degree', 'in': 'in_degree', 'out': 'out_degree'}[deg_type]
+    arrs = [np.fromiter((d for n, d in getattr(G, attr)()), dtype=np.int64, count=G.number_of_nodes())
+            for G, coords in networks]
+    return np.concatenate(arrs) if arrs else np.empty(0, dtype=np.int64)
+
+_PLOT_KWARGS = {
+    'full': {'markersize': 3, 'linewidth': 2, 'alpha': 0.5},
+    'log': {'markersize': 5, 'linewidth': 2, 'alpha': 1.},
+    'cdf': {'markersize': 2, 'linewidth': 2, 'alpha': 1.}
+}
 
 def plot_distribution(x, y, fmt='o', plt_type='full', plt_func=plt.loglog, **kwargs):
     '''
@@ -172,11 +242,6 @@ def plot_distribution(x, y, fmt='o', plt_type='full', plt_func=plt.loglog, **kwa
         a list of `~.Line2D` objects representing the plotted data
         
     '''
-    plot_kwargs = {
-        'full': {'markersize': 3, 'linewidth': 2, 'alpha': 0.5},
-        'log': {'markersize': 5, 'linewidth': 2, 'alpha': 1.},
-        'cdf': {'markersize': 2, 'linewidth': 2, 'alpha': 1.}
-    }
-    res_kwargs = plot_kwargs[plt_type] if plt_type else dict()
+    res_kwargs = dict(_PLOT_KWARGS[plt_type]) if plt_type else dict()
     res_kwargs.update(kwargs)
     return plt_func(x, y, fmt, **res_kwargs)
\ No newline at end of file